@@ -6,16 +6,27 @@ web/data/incidents.json for the browser-based game.
 """
 
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not available, fall back to pure-Python parser
+    from yaml import SafeLoader as _YamlLoader
 
-def get_severity_order(severity: str) -> int:
-    """Return sort order for severity (lower = more severe)."""
-    order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-    return order.get(severity.lower() if severity else "", 2)
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json works fine without it
+    orjson = None
+
+
+# Sort order for severity (lower = more severe)
+SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
 
 
 def parse_logs(logs_data) -> list[str]:
@@ -79,17 +90,19 @@ def parse_metrics(metrics_data) -> dict:
 def load_incident(filepath: Path) -> dict | None:
     """Load and normalize a single incident YAML file."""
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        with open(filepath, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
         
         if not data or not isinstance(data, dict):
             return None
         
-        # Extract and normalize fields
+        # Extract and normalize fields (severity is lowercased once here
+        # so rank lookups and the sort never re-normalize it)
+        severity = str(data.get("severity") or "medium").lower()
         incident = {
             "id": data.get("id", filepath.stem),
             "title": data.get("title", "Untitled Incident"),
-            "severity": data.get("severity", "medium"),
+            "severity": severity,
             "description": data.get("description", ""),
             "services": data.get("services", data.get("affected_services", [])),
             "metrics": parse_metrics(data.get("metrics", {})),
@@ -102,7 +115,7 @@ def load_incident(filepath: Path) -> dict | None:
         # Derived fields for game
         desc = incident["description"]
         incident["short_summary"] = desc.split(".")[0] + "." if desc and "." in desc else desc
-        incident["severity_rank"] = get_severity_order(incident["severity"])
+        incident["severity_rank"] = SEVERITY_ORDER.get(severity, 2)
         
         # Default actions if none provided
         if not incident["available_actions"]:
@@ -123,43 +136,83 @@ def load_incident(filepath: Path) -> dict | None:
         return None
 
 
+def find_yaml_files(directory: Path) -> list[Path]:
+    """List YAML files in a directory with a single scandir pass.
+
+    One walk with an extension check replaces the double glob for
+    *.yaml and *.yml (and the per-entry Path construction glob does).
+    """
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+            and entry.name.endswith((".yaml", ".yml"))
+        ]
+
+
+def build_incidents_list(input_dir: Path) -> list[dict]:
+    """Load, normalize and sort every incident under input_dir.
+
+    Reads YAML files from input_dir itself plus its generated/
+    subdirectory, if present. Pure apart from the reads, so tests can
+    run it against a small fixture directory without touching the
+    repo's incident pack or the web output file.
+    """
+    yaml_files = find_yaml_files(input_dir) if input_dir.exists() else []
+
+    generated_dir = input_dir / "generated"
+    if generated_dir.exists():
+        yaml_files += find_yaml_files(generated_dir)
+
+    if not yaml_files:
+        return []
+
+    # Each file parses independently, so load them in parallel. Process
+    # pools only pay off once there are enough files to amortize worker
+    # startup; below that a thread pool keeps the overhead negligible.
+    if len(yaml_files) >= 32:
+        executor_cls = ProcessPoolExecutor
+    else:
+        executor_cls = ThreadPoolExecutor
+
+    incidents = []
+    with executor_cls() as executor:
+        for incident in executor.map(load_incident, yaml_files, chunksize=8):
+            if incident:
+                incidents.append(incident)
+
+    # Sort by severity (critical first), then by id. severity_rank is
+    # already computed in load_incident, so sort on it directly instead
+    # of re-deriving the rank per comparison.
+    incidents.sort(key=itemgetter("severity_rank", "id"))
+    return incidents
+
+
 def main():
     """Main entry point."""
     # Determine paths
     script_dir = Path(__file__).parent
     repo_root = script_dir.parent
     incidents_dir = repo_root / "incidents"
-    generated_dir = incidents_dir / "generated"
     output_dir = repo_root / "web" / "data"
     output_file = output_dir / "incidents.json"
-    
+
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Load all incidents from both directories
-    incidents = []
-    
-    # Hand-written incidents
-    yaml_files = list(incidents_dir.glob("*.yaml")) + list(incidents_dir.glob("*.yml"))
-    
-    # Generated incidents
-    if generated_dir.exists():
-        yaml_files += list(generated_dir.glob("*.yaml")) + list(generated_dir.glob("*.yml"))
-    
-    if not yaml_files:
+
+    incidents = build_incidents_list(incidents_dir)
+    if not incidents:
         print(f"Warning: No YAML files found in {incidents_dir}", file=sys.stderr)
-    
-    for filepath in yaml_files:
-        incident = load_incident(filepath)
-        if incident:
-            incidents.append(incident)
-    
-    # Sort by severity (critical first), then by id
-    incidents.sort(key=lambda x: (get_severity_order(x["severity"]), x["id"]))
-    
-    # Write JSON output
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(incidents, f, indent=2, ensure_ascii=False)
+
+    # Write JSON output. The file is only read by the web app, so emit
+    # compact JSON; orjson encodes in native code and writes UTF-8 bytes
+    # directly when available.
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(incidents))
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(incidents, f, ensure_ascii=False, separators=(",", ":"), check_circular=False)
     
     print(f"[OK] Exported {len(incidents)} incidents to {output_file}")
     return 0
@@ -7,10 +7,20 @@ Deterministic given a seed for reproducible builds.
 
 import argparse
 import hashlib
+import os
 import random
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import yaml
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # libyaml not available, fall back to pure-Python emitter
+    from yaml import SafeDumper as _YamlDumper
+
 # ═══════════════════════════════════════════════════════════════
 # Incident Templates by Category
 # ═══════════════════════════════════════════════════════════════
@@ -102,6 +112,9 @@ CATEGORIES = {
     },
 }
 
+# Category names frozen once so the generation loop doesn't rebuild the list
+CATEGORY_KEYS = tuple(CATEGORIES)
+
 SEVERITIES = ["critical", "high", "medium", "low"]
 SEVERITY_WEIGHTS = [1, 2, 4, 3]  # Distribution
 
@@ -155,28 +168,39 @@ def generate_seed_rng(seed: str) -> random.Random:
 
 def generate_incident(rng: random.Random, index: int) -> dict:
     """Generate a single incident with realistic data."""
-    category = rng.choice(list(CATEGORIES.keys()))
+    # Bind the hot RNG methods to locals: ~40 draws happen per incident
+    # and each dotted lookup costs an attribute fetch.
+    randint = rng.randint
+    choice = rng.choice
+
+    category = choice(CATEGORY_KEYS)
     cat_data = CATEGORIES[category]
     
-    title = rng.choice(cat_data["titles"])
+    title = choice(cat_data["titles"])
     severity = rng.choices(SEVERITIES, weights=SEVERITY_WEIGHTS)[0]
-    services = rng.sample(cat_data["services"], min(rng.randint(2, 4), len(cat_data["services"])))
+    services = rng.sample(cat_data["services"], min(randint(2, 4), len(cat_data["services"])))
     
     # Generate ID
     inc_id = f"GEN-{index:03d}"
-    
+
+    # Hoist the service lookups used repeatedly below
+    svc0 = services[0]
+    dep = services[1] if len(services) > 1 else "database"
+    cache_dep = services[1] if len(services) > 1 else "cache"
+    title_lower = title.lower()
+
     # Description
-    desc_template = rng.choice(DESCRIPTIONS)
+    desc_template = choice(DESCRIPTIONS)
     description = desc_template.format(
-        feature="the checkout flow" if "payment" in title.lower() else "core functionality",
-        cause="connection pool exhaustion" if "pool" in title.lower() else "increased traffic",
-        svc=services[0],
+        feature="the checkout flow" if "payment" in title_lower else "core functionality",
+        cause="connection pool exhaustion" if "pool" in title_lower else "increased traffic",
+        svc=svc0,
         symptom="error rates climbing",
-        area="the payment processing pipeline" if "payment" in title.lower() else "infrastructure",
+        area="the payment processing pipeline" if "payment" in title_lower else "infrastructure",
         metric="error_rate" if rng.random() > 0.5 else "p95_latency",
         impact="moderate" if severity in ["medium", "low"] else "high",
         problem="cascading failures" if severity == "critical" else "degraded performance",
-        dep=services[1] if len(services) > 1 else "database",
+        dep=dep,
         radius="expanding" if severity in ["critical", "high"] else "contained",
     )
     
@@ -185,39 +209,39 @@ def generate_incident(rng: random.Random, index: int) -> dict:
     base_latency = {"critical": 3500, "high": 2000, "medium": 800, "low": 300}[severity]
     
     metrics = {
-        "error_rate": base_error + rng.randint(-5, 15),
-        "p95_latency": base_latency + rng.randint(-200, 500),
-        "cpu_usage": rng.randint(40, 95),
-        "memory_usage": rng.randint(50, 90),
-        "request_rate": rng.randint(500, 5000),
+        "error_rate": base_error + randint(-5, 15),
+        "p95_latency": base_latency + randint(-200, 500),
+        "cpu_usage": randint(40, 95),
+        "memory_usage": randint(50, 90),
+        "request_rate": randint(500, 5000),
     }
     
     # Logs
     logs = []
-    for i in range(rng.randint(6, 10)):
-        log = rng.choice(LOG_TEMPLATES).format(
-            ts=f"2024-01-15T10:{rng.randint(0,59):02d}:{rng.randint(0,59):02d}Z",
-            svc=rng.choice(services),
-            dep=services[1] if len(services) > 1 else "database",
-            req_id=f"req-{rng.randint(1000,9999)}",
+    for i in range(randint(6, 10)):
+        log = choice(LOG_TEMPLATES).format(
+            ts=f"2024-01-15T10:{randint(0,59):02d}:{randint(0,59):02d}Z",
+            svc=choice(services),
+            dep=dep,
+            req_id=f"req-{randint(1000,9999)}",
         )
         logs.append(log)
     
     # Traces
     traces = []
-    for i in range(rng.randint(3, 6)):
-        trace = rng.choice(TRACE_TEMPLATES).format(
-            span=f"{rng.randint(1000,9999):04x}",
-            svc=rng.choice(services),
-            dep=services[1] if len(services) > 1 else "cache",
-            dur=rng.randint(50, 3000),
+    for i in range(randint(3, 6)):
+        trace = choice(TRACE_TEMPLATES).format(
+            span=f"{randint(1000,9999):04x}",
+            svc=choice(services),
+            dep=cache_dep,
+            dur=randint(50, 3000),
         )
         traces.append(trace)
     
     # Actions
     actions = []
     available = cat_data["actions"][:]
-    correct = rng.choice(available)
+    correct = choice(available)
     rng.shuffle(available)
     for action in available[:4]:
         actions.append({
@@ -247,63 +271,64 @@ def generate_incident(rng: random.Random, index: int) -> dict:
     }
 
 
+# Filename slug pattern: collapses any run of non-alphanumerics to one dash
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Canonical field order for generated YAML files
+_FIELD_ORDER = ["id", "title", "severity", "category", "description", "tags", "services",
+                "metrics", "logs", "traces", "actions", "available_actions", "correct_action",
+                "optimal_resolution_steps"]
+
+
+def dump_yaml(incident: dict) -> bytes:
+    """Serialize an incident dict to YAML bytes."""
+    ordered = {key: incident[key] for key in _FIELD_ORDER if key in incident}
+    data = yaml.dump(
+        ordered,
+        Dumper=_YamlDumper,
+        sort_keys=False,
+        allow_unicode=True,
+        default_flow_style=False,
+    )
+    return data.encode("utf-8")
+
+
+def write_if_changed(output_path: Path, data: bytes) -> None:
+    """Write bytes to a file, skipping the write if content is identical.
+
+    Leaving unchanged files untouched preserves their mtimes, so
+    downstream tooling doesn't see spurious rebuilds.
+    """
+    if output_path.exists() and output_path.read_bytes() == data:
+        return
+    # Write through the raw fd: one open/write/close without the
+    # buffered-IO layer that Path.write_bytes would set up per file.
+    fd = os.open(str(output_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 def write_yaml(incident: dict, output_path: Path) -> None:
     """Write incident dict as YAML file."""
-    lines = []
-    
-    def add_field(key: str, value, indent: int = 0):
-        prefix = "  " * indent
-        if isinstance(value, str):
-            if "\n" in value or len(value) > 80:
-                lines.append(f"{prefix}{key}: |")
-                for line in value.split("\n"):
-                    lines.append(f"{prefix}  {line}")
-            else:
-                # Escape quotes
-                escaped = value.replace('"', '\\"')
-                lines.append(f'{prefix}{key}: "{escaped}"')
-        elif isinstance(value, (int, float)):
-            lines.append(f"{prefix}{key}: {value}")
-        elif isinstance(value, list):
-            if all(isinstance(x, str) for x in value):
-                lines.append(f"{prefix}{key}:")
-                for item in value:
-                    escaped = item.replace('"', '\\"')
-                    lines.append(f'{prefix}  - "{escaped}"')
-            elif all(isinstance(x, dict) for x in value):
-                lines.append(f"{prefix}{key}:")
-                for item in value:
-                    first = True
-                    for k, v in item.items():
-                        if first:
-                            escaped = str(v).replace('"', '\\"')
-                            lines.append(f'{prefix}  - {k}: "{escaped}"')
-                            first = False
-                        else:
-                            escaped = str(v).replace('"', '\\"')
-                            lines.append(f'{prefix}    {k}: "{escaped}"')
-            else:
-                lines.append(f"{prefix}{key}: {value}")
-        elif isinstance(value, dict):
-            lines.append(f"{prefix}{key}:")
-            for k, v in value.items():
-                add_field(k, v, indent + 1)
-    
-    for key in ["id", "title", "severity", "category", "description", "tags", "services", 
-                "metrics", "logs", "traces", "actions", "available_actions", "correct_action",
-                "optimal_resolution_steps"]:
-        if key in incident:
-            add_field(key, incident[key])
-    
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    write_if_changed(output_path, dump_yaml(incident))
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (constructed once, reused per call)."""
     parser = argparse.ArgumentParser(description="Generate incident pack for web game")
     parser.add_argument("--seed", type=str, default="default-seed", help="Random seed for deterministic generation")
     parser.add_argument("--count", type=int, default=30, help="Number of incidents to generate")
     parser.add_argument("--output", type=str, default=None, help="Output directory (default: incidents/generated)")
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = build_parser()
+
+
+def main():
+    args = _PARSER.parse_args()
     
     # Determine output directory
     if args.output:
@@ -314,18 +339,24 @@ def main():
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Generate incidents
+    # Generate incidents. Generation stays serial so the RNG sequence is
+    # deterministic; only the (I/O-bound) writes are fanned out.
     rng = generate_seed_rng(str(args.seed))
-    
+
+    pending: list[tuple[Path, bytes]] = []
     for i in range(1, args.count + 1):
         incident = generate_incident(rng, i)
-        
+
         # Create filename from id and title
-        safe_title = incident["title"].lower().replace(" ", "-").replace("/", "-")[:30]
+        safe_title = _SLUG_RE.sub("-", incident["title"].lower())[:30]
         filename = f"{incident['id']}-{safe_title}.yaml"
         filepath = output_dir / filename
-        
-        write_yaml(incident, filepath)
+
+        pending.append((filepath, dump_yaml(incident)))
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for _ in executor.map(lambda item: write_if_changed(*item), pending):
+            pass
     
     print(f"[OK] Generated {args.count} incidents to {output_dir}")
     return 0
@@ -3,13 +3,22 @@
 A terminal/CLI incident-response simulator where you 'brew' fixes from noisy alerts.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Alert Alchemy Contributors"
 
-from alert_alchemy.models import Incident, GameState
-from alert_alchemy.engine import Engine
-from alert_alchemy.loader import load_incidents
-from alert_alchemy.scoring import calculate_score, calculate_blast_radius
+# Public API re-exports, resolved lazily (PEP 562) so importing the
+# package doesn't pull in yaml/the engine for CLI commands that never
+# touch them.
+_EXPORTS = {
+    "Incident": "alert_alchemy.models",
+    "GameState": "alert_alchemy.models",
+    "Engine": "alert_alchemy.engine",
+    "load_incidents": "alert_alchemy.loader",
+    "calculate_score": "alert_alchemy.scoring",
+    "calculate_blast_radius": "alert_alchemy.scoring",
+}
 
 __all__ = [
     "__version__",
@@ -20,3 +29,12 @@ __all__ = [
     "calculate_score",
     "calculate_blast_radius",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
@@ -12,25 +12,16 @@ Commands:
 - tick: Advance time without action (advances time +1)
 - end: End the current game
 - reset: Clear game state
+
+Heavy modules (rich rendering, the engine and its YAML loader) are
+imported inside the commands that need them, so cold invocations only
+pay for what the subcommand actually uses.
 """
 
 from typing import Optional
 
 import typer
-from rich.console import Console
-
-from alert_alchemy.engine import Engine
-from alert_alchemy.render import (
-    console,
-    render_action_result,
-    render_game_end,
-    render_incident_detail,
-    render_logs,
-    render_metrics,
-    render_no_state_message,
-    render_status,
-    render_traces,
-)
+
 from alert_alchemy.state import load_state, state_exists
 
 app = typer.Typer(
@@ -40,19 +31,24 @@ app = typer.Typer(
 )
 
 
-def get_engine() -> Engine:
+def get_engine():
     """Get an engine instance."""
+    from alert_alchemy.engine import Engine
     return Engine()
 
 
-def require_state(func):
-    """Decorator to require an active game state."""
-    def wrapper(*args, **kwargs):
-        if not state_exists():
-            render_no_state_message()
-            raise typer.Exit(1)
-        return func(*args, **kwargs)
-    return wrapper
+def require_state():
+    """Load the game state, exiting with a hint if there is none.
+
+    Loads the state file once instead of the old stat-then-parse
+    (state_exists + load_state) round-trip every command repeated.
+    """
+    state = load_state()
+    if state is None:
+        from alert_alchemy.render import render_no_state_message
+        render_no_state_message()
+        raise typer.Exit(1)
+    return state
 
 
 @app.command()
@@ -64,6 +60,9 @@ def start(
     ),
 ) -> None:
     """Start a new game session."""
+    from alert_alchemy.engine import Engine
+    from alert_alchemy.render import console
+
     if state_exists():
         existing = load_state()
         if existing and not existing.ended:
@@ -74,13 +73,13 @@ def start(
             if not overwrite:
                 console.print("[yellow]Keeping existing game.[/yellow]")
                 raise typer.Exit(0)
-    
+
     engine = Engine(incidents_path=incidents_path)
     state = engine.start_game()
-    
+
     console.print("[bold green]🎮 New game started![/bold green]")
     console.print(f"Loaded [bold]{len(state.incidents)}[/bold] incident(s).")
-    
+
     if state.incidents:
         console.print("\n[yellow]Use 'alert-alchemy status' to view incidents.[/yellow]")
     else:
@@ -90,60 +89,36 @@ def start(
 @app.command()
 def status() -> None:
     """Show current game status and incidents (does NOT advance time)."""
-    if not state_exists():
-        render_no_state_message()
-        raise typer.Exit(1)
-    
-    state = load_state()
-    if state is None:
-        render_no_state_message()
-        raise typer.Exit(1)
-    
+    from alert_alchemy.render import render_status
+
+    state = require_state()
     render_status(state)
 
 
 @app.command()
 def logs() -> None:
     """Show incident logs (does NOT advance time)."""
-    if not state_exists():
-        render_no_state_message()
-        raise typer.Exit(1)
-    
-    state = load_state()
-    if state is None:
-        render_no_state_message()
-        raise typer.Exit(1)
-    
+    from alert_alchemy.render import render_logs
+
+    state = require_state()
     render_logs(state)
 
 
 @app.command()
 def metrics() -> None:
     """Show metrics table for all incidents (does NOT advance time)."""
-    if not state_exists():
-        render_no_state_message()
-        raise typer.Exit(1)
-    
-    state = load_state()
-    if state is None:
-        render_no_state_message()
-        raise typer.Exit(1)
-    
+    from alert_alchemy.render import render_metrics
+
+    state = require_state()
     render_metrics(state)
 
 
 @app.command()
 def traces() -> None:
     """Show traces for active incidents (does NOT advance time)."""
-    if not state_exists():
-        render_no_state_message()
-        raise typer.Exit(1)
-    
-    state = load_state()
-    if state is None:
-        render_no_state_message()
-        raise typer.Exit(1)
-    
+    from alert_alchemy.render import render_traces
+
+    state = require_state()
     render_traces(state)
 
 
@@ -153,28 +128,30 @@ def action(
     second_arg: Optional[str] = typer.Argument(None, help="Action name (if first arg is incident ID)"),
 ) -> None:
     """Take an action on an incident (advances time +1).
-    
+
     Can be used in multiple ways:
     - action INC-001 rollback  (explicit incident and action)
     - action rollback          (auto-select incident if only one active)
     - action                   (interactive selection)
     """
-    if not state_exists():
-        render_no_state_message()
-        raise typer.Exit(1)
-    
+    from alert_alchemy.render import console, render_action_result, render_no_state_message
+
     from alert_alchemy.interactive import smart_action
-    
+
     engine = get_engine()
-    
-    if engine.state and engine.state.ended:
+
+    if engine.state is None:
+        render_no_state_message()
+        raise typer.Exit(1)
+
+    if engine.state.ended:
         console.print("[yellow]Game has ended. Use 'alert-alchemy reset' to start fresh.[/yellow]")
         raise typer.Exit(1)
-    
+
     # Determine incident_id and action_name from arguments
     incident_id: Optional[str] = None
     action_name: Optional[str] = None
-    
+
     if first_arg and second_arg:
         # Both provided: first is incident, second is action
         incident_id = first_arg
@@ -190,17 +167,17 @@ def action(
                 if inc.id == first_arg:
                     matching_incident = inc
                     break
-            
+
             if matching_incident:
                 # It's an incident ID
                 incident_id = first_arg
             else:
                 # Assume it's an action name
                 action_name = first_arg
-    
+
     success, message = smart_action(action_name, incident_id, engine)
     render_action_result(success, message)
-    
+
     if success and engine.state:
         console.print(f"[dim]Step: {engine.state.current_step} | Score: {engine.state.score}[/dim]")
         console.print("\n[dim]💡 Tip: Use 'status' or 'metrics' to check the situation.[/dim]")
@@ -209,19 +186,21 @@ def action(
 @app.command()
 def tick() -> None:
     """Advance time by one step without taking an action (advances time +1)."""
-    if not state_exists():
+    from alert_alchemy.render import console, render_action_result, render_no_state_message
+
+    engine = get_engine()
+
+    if engine.state is None:
         render_no_state_message()
         raise typer.Exit(1)
-    
-    engine = get_engine()
-    
-    if engine.state and engine.state.ended:
+
+    if engine.state.ended:
         console.print("[yellow]Game has ended. Use 'alert-alchemy reset' to start fresh.[/yellow]")
         raise typer.Exit(1)
-    
+
     success, message = engine.tick()
     render_action_result(success, message)
-    
+
     if success and engine.state:
         console.print(f"[dim]Score: {engine.state.score}[/dim]")
 
@@ -229,19 +208,21 @@ def tick() -> None:
 @app.command()
 def end() -> None:
     """End the current game and show final score."""
-    if not state_exists():
+    from alert_alchemy.render import console, render_game_end, render_no_state_message
+
+    engine = get_engine()
+
+    if engine.state is None:
         render_no_state_message()
         raise typer.Exit(1)
-    
-    engine = get_engine()
-    
-    if engine.state and engine.state.ended:
+
+    if engine.state.ended:
         console.print("[yellow]Game has already ended.[/yellow]")
         render_game_end(engine.state)
         raise typer.Exit(0)
-    
+
     success, message = engine.end_game()
-    
+
     if success and engine.state:
         render_game_end(engine.state)
     else:
@@ -253,19 +234,21 @@ def reset(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ) -> None:
     """Reset/clear the current game state."""
+    from alert_alchemy.render import console
+
     if not state_exists():
         console.print("[dim]No game state to reset.[/dim]")
         raise typer.Exit(0)
-    
+
     if not force:
         confirm = typer.confirm("Are you sure you want to reset the game?", default=False)
         if not confirm:
             console.print("[yellow]Reset cancelled.[/yellow]")
             raise typer.Exit(0)
-    
+
     engine = get_engine()
     success, message = engine.reset_game()
-    
+
     console.print(f"[green]{message}[/green]")
 
 
@@ -274,20 +257,15 @@ def show(
     incident_id: str = typer.Argument(..., help="ID of the incident to show"),
 ) -> None:
     """Show detailed information about a specific incident."""
-    if not state_exists():
-        render_no_state_message()
-        raise typer.Exit(1)
-    
-    state = load_state()
-    if state is None:
-        render_no_state_message()
-        raise typer.Exit(1)
-    
+    from alert_alchemy.render import console, render_incident_detail
+
+    state = require_state()
+
     for incident in state.incidents:
         if incident.id == incident_id:
             render_incident_detail(incident)
             return
-    
+
     console.print(f"[red]Incident '{incident_id}' not found.[/red]")
     raise typer.Exit(1)
 
@@ -295,7 +273,7 @@ def show(
 @app.command()
 def play() -> None:
     """Start interactive guided mode (recommended for beginners).
-    
+
     Provides a menu-driven interface for playing the game without
     needing to remember command syntax.
     """
@@ -308,20 +286,13 @@ def actions(
     incident_id: Optional[str] = typer.Argument(None, help="Show actions for specific incident only"),
 ) -> None:
     """Show available actions per incident at the current step.
-    
+
     Examples:
     - actions          (list all incidents with their actions)
     - actions INC-002  (show only that incident's actions)
     """
-    if not state_exists():
-        render_no_state_message()
-        raise typer.Exit(1)
-    
-    state = load_state()
-    if state is None:
-        render_no_state_message()
-        raise typer.Exit(1)
-    
+    state = require_state()
+
     from alert_alchemy.interactive import render_actions_list
     render_actions_list(state, incident_id)
 
@@ -1,41 +1,85 @@
 """Core game engine for Alert Alchemy."""
 
+import sys
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional
 
 from alert_alchemy.loader import load_incidents
 from alert_alchemy.models import ActionRecord, GameState, Incident
-from alert_alchemy.scoring import calculate_score
+from alert_alchemy.scoring import PENALTY_PER_STEP, calculate_score
 from alert_alchemy.state import delete_state, load_state, save_state
 
+# Action keywords that suggest a risky intervention when incorrect
+_WORSEN_KEYWORDS = ("restart", "reboot", "delete", "drop", "kill")
+
 
 class Engine:
     """Core game engine managing game state and actions."""
     
-    def __init__(self, incidents_path: str = "./incidents") -> None:
+    def __init__(self, incidents_path: str = "./incidents", state_dir: Optional[Path] = None) -> None:
         """Initialize the engine.
-        
+
         Args:
             incidents_path: Path to the incidents directory.
+            state_dir: Directory for the state file. Defaults to the
+                current working directory; passing it explicitly avoids
+                process-global chdir in tests.
         """
         self.incidents_path = incidents_path
+        self.state_dir = state_dir
         self._state: Optional[GameState] = None
-    
+        self._dirty = False
+        self._defer_saves = False
+
     @property
     def state(self) -> Optional[GameState]:
         """Get current game state, loading from disk if needed."""
         if self._state is None:
-            self._state = load_state()
+            self._state = load_state(self.state_dir)
         return self._state
+
+    def flush(self) -> None:
+        """Write pending state changes to disk, if any."""
+        if self._dirty and self._state is not None:
+            save_state(self._state, self.state_dir)
+            self._dirty = False
+
+    def _save(self) -> None:
+        """Mark state dirty and persist it unless saves are being batched."""
+        self._dirty = True
+        if not self._defer_saves:
+            self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["Engine"]:
+        """Coalesce state saves across several mutations.
+
+        Inside the block, take_action/tick only mark state dirty; a
+        single save happens on exit. Useful for loops that would
+        otherwise serialize and rewrite the state file per step.
+        """
+        self._defer_saves = True
+        try:
+            yield self
+        finally:
+            self._defer_saves = False
+            self.flush()
     
-    def start_game(self) -> GameState:
+    def start_game(self, incidents: Optional[list[Incident]] = None) -> GameState:
         """Start a new game.
-        
+
+        Args:
+            incidents: Pre-built incidents to play with. Loaded from
+                incidents_path when omitted.
+
         Returns:
             The new game state.
         """
-        incidents = load_incidents(self.incidents_path)
-        
+        if incidents is None:
+            incidents = load_incidents(self.incidents_path)
+
         self._state = GameState(
             current_step=0,
             score=100,
@@ -44,8 +88,8 @@ class Engine:
             started_at=datetime.now().isoformat(),
             ended=False,
         )
-        
-        save_state(self._state)
+
+        save_state(self._state, self.state_dir)
         return self._state
     
     def take_action(self, incident_id: str, action: str) -> tuple[bool, str]:
@@ -60,30 +104,47 @@ class Engine:
         Returns:
             Tuple of (success, message).
         """
+        success, message, _ = self._take_action(incident_id, action)
+        return success, message
+
+    def _take_action(self, incident_id: str, action: str) -> tuple[bool, str, Optional[Incident]]:
+        """Take an action and also return the affected incident.
+
+        Internal variant of take_action so callers that need the
+        incident afterwards (resolve_incident) avoid a second lookup.
+
+        Returns:
+            Tuple of (success, message, incident or None).
+        """
+        # Interned loader-side strings make these lookups and the
+        # correctness comparison pointer-equal in the common case
+        incident_id = sys.intern(incident_id)
+        action = sys.intern(action)
+
         if self.state is None:
-            return False, "No active game. Run 'alert-alchemy start' first."
-        
+            return False, "No active game. Run 'alert-alchemy start' first.", None
+
         if self.state.ended:
-            return False, "Game has already ended."
-        
+            return False, "Game has already ended.", None
+
         # Find the incident
         incident = self._find_incident(incident_id)
         if incident is None:
-            return False, f"Incident '{incident_id}' not found."
-        
+            return False, f"Incident '{incident_id}' not found.", None
+
         if incident.resolved:
-            return False, f"Incident '{incident_id}' is already resolved."
-        
-        # Check if action is valid
-        if action not in incident.available_actions:
-            return False, f"Action '{action}' is not available for this incident."
-        
+            return False, f"Incident '{incident_id}' is already resolved.", incident
+
+        # Check if action is valid (hashed membership, not a list scan)
+        if action not in incident._available_actions_set:
+            return False, f"Action '{action}' is not available for this incident.", incident
+
         # Advance time
         self.state.current_step += 1
         
         # Check if action is correct
         is_correct = action == incident.correct_action
-        worsened = self._did_action_worsen(incident, action)
+        worsened = self._did_action_worsen(action, is_correct)
         
         # Record the action
         record = ActionRecord(
@@ -99,6 +160,8 @@ class Engine:
         if is_correct:
             incident.resolved = True
             incident.resolved_at_step = self.state.current_step
+            if incident in self.state.active_incidents:
+                self.state.active_incidents.remove(incident)
             message = f"✓ Incident '{incident_id}' resolved!"
         else:
             message = f"Action taken, but incident not resolved."
@@ -108,9 +171,9 @@ class Engine:
         # Update score
         self.state.score = calculate_score(self.state)
         
-        save_state(self.state)
-        return True, message
-    
+        self._save()
+        return True, message, incident
+
     def tick(self) -> tuple[bool, str]:
         """Advance time by one step without taking an action.
         
@@ -124,9 +187,12 @@ class Engine:
             return False, "Game has already ended."
         
         self.state.current_step += 1
-        self.state.score = calculate_score(self.state)
-        
-        save_state(self.state)
+        # A tick changes nothing but the step counter, so apply the time
+        # penalty incrementally instead of re-summing every action and
+        # incident. take_action/end_game still do the full recompute.
+        self.state.score -= PENALTY_PER_STEP
+
+        self._save()
         return True, f"Time advanced to step {self.state.current_step}."
     
     def end_game(self) -> tuple[bool, str]:
@@ -145,7 +211,7 @@ class Engine:
         self.state.ended_at = datetime.now().isoformat()
         self.state.score = calculate_score(self.state)
         
-        save_state(self.state)
+        self._save()
         return True, f"Game ended with final score: {self.state.score}"
     
     def reset_game(self) -> tuple[bool, str]:
@@ -154,8 +220,9 @@ class Engine:
         Returns:
             Tuple of (success, message).
         """
-        deleted = delete_state()
+        deleted = delete_state(self.state_dir)
         self._state = None
+        self._dirty = False
         
         if deleted:
             return True, "Game state reset."
@@ -171,15 +238,14 @@ class Engine:
         Returns:
             Tuple of (success, message, was_correct).
         """
-        success, message = self.take_action(incident_id, action)
-        
+        success, message, incident = self._take_action(incident_id, action)
+
         if not success:
             return success, message, False
-        
+
         # Check if it was the correct action
-        incident = self._find_incident(incident_id)
         was_correct = incident is not None and incident.resolved
-        
+
         return success, message, was_correct
     
     def _find_incident(self, incident_id: str) -> Optional[Incident]:
@@ -193,31 +259,39 @@ class Engine:
         """
         if self.state is None:
             return None
-        
-        for incident in self.state.incidents:
-            if incident.id == incident_id:
-                return incident
+
+        return self.state._by_id.get(incident_id)
+
+    def get_active_incident(self, incident_id: str) -> Optional[Incident]:
+        """Find an unresolved incident by ID.
+
+        Args:
+            incident_id: The incident ID to find.
+
+        Returns:
+            The incident if it exists and is not resolved, else None.
+        """
+        incident = self._find_incident(incident_id)
+        if incident is not None and not incident.resolved:
+            return incident
         return None
     
-    def _did_action_worsen(self, incident: Incident, action: str) -> bool:
+    def _did_action_worsen(self, action: str, is_correct: bool) -> bool:
         """Check if an action worsened the incident.
-        
+
         For now, this is a simple heuristic: certain keywords indicate worsening.
-        
+
         Args:
-            incident: The incident.
             action: The action taken.
-            
+            is_correct: Whether the action was the correct one (already
+                computed by the caller).
+
         Returns:
             True if the action worsened the situation.
         """
-        worsen_keywords = ["restart", "reboot", "delete", "drop", "kill"]
+        # The correct action never worsens; only scan keywords otherwise
+        if is_correct:
+            return False
+
         action_lower = action.lower()
-        
-        # If it's not the correct action and contains worsen keywords
-        if action != incident.correct_action:
-            for keyword in worsen_keywords:
-                if keyword in action_lower:
-                    return True
-        
-        return False
+        return any(keyword in action_lower for keyword in _WORSEN_KEYWORDS)
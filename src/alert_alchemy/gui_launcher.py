@@ -5,57 +5,66 @@ Opens the web game in a native window without needing a browser.
 
 import http.server
 import os
-import socketserver
 import sys
 import threading
 from pathlib import Path
 
+# Resolved once at import: the module directory and, for PyInstaller
+# bundles, the unpack directory (None when running from source).
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_MEIPASS = getattr(sys, '_MEIPASS', None)
+
 
 def find_web_folder() -> Path:
     """Find the web folder with game assets."""
-    # Try relative to this file (dev mode)
-    module_dir = Path(__file__).parent
-    
-    # Check for bundled assets (PyInstaller)
-    if getattr(sys, 'frozen', False):
-        base_path = Path(sys._MEIPASS)  # type: ignore
-        web_path = base_path / 'web'
-        if web_path.exists():
-            return web_path
-    
-    # Dev mode - look for web folder
-    candidates = [
-        module_dir.parent.parent / 'web',  # src/alert_alchemy/../../web
-        Path.cwd() / 'web',
-    ]
-    
+    # Bundled assets (PyInstaller) - short-circuit before the dev paths
+    if _MEIPASS is not None:
+        web_path = os.path.join(_MEIPASS, 'web')
+        if os.path.isdir(web_path):
+            return Path(web_path)
+
+    # Dev mode - plain string joins and a single isfile() per candidate
+    candidates = (
+        os.path.join(_MODULE_DIR, '..', '..', 'web'),  # src/alert_alchemy/../../web
+        os.path.join(os.getcwd(), 'web'),
+    )
+
     for path in candidates:
-        if (path / 'index.html').exists():
-            return path
-    
+        if os.path.isfile(os.path.join(path, 'index.html')):
+            return Path(path)
+
     raise FileNotFoundError("Could not find web folder with game assets")
 
 
-def start_server(web_folder: Path, port: int) -> socketserver.TCPServer:
-    """Start a local HTTP server serving the web folder."""
-    os.chdir(web_folder)
-    
-    handler = http.server.SimpleHTTPRequestHandler
-    handler.log_message = lambda *args: None  # Suppress logs
-    
-    server = socketserver.TCPServer(("127.0.0.1", port), handler)
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    """Request handler without logging or reverse-DNS lookups."""
+
+    def log_message(self, *args) -> None:  # Suppress logs
+        pass
+
+    def address_string(self) -> str:
+        # Skip the reverse-DNS lookup the base class does per request
+        return self.client_address[0]
+
+
+def start_server(web_folder: Path, port: int = 0) -> http.server.ThreadingHTTPServer:
+    """Start a local HTTP server serving the web folder.
+
+    With port 0 (the default) the OS picks a free port during bind;
+    read it back from server.server_address. This avoids the
+    probe-then-rebind race a separate find-free-port helper would have.
+    """
+    import functools
+
+    # directory= serves web_folder without chdir'ing the whole process;
+    # the threading server lets the webview fetch assets concurrently.
+    handler = functools.partial(_QuietHandler, directory=str(web_folder))
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", port), handler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
-    
-    return server
 
-
-def find_free_port() -> int:
-    """Find a free port to bind the server."""
-    import socket
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(('127.0.0.1', 0))
-        return s.getsockname()[1]
+    return server
 
 
 def main():
@@ -85,9 +94,9 @@ def main():
         except Exception:
             pass  # Continue anyway, game may show empty
     
-    # Start local server
-    port = find_free_port()
-    server = start_server(web_folder, port)
+    # Start local server on an OS-assigned port
+    server = start_server(web_folder)
+    port = server.server_address[1]
     
     try:
         # Create window
@@ -3,6 +3,7 @@
 Provides a guided, menu-driven interface for non-developer users.
 """
 
+import functools
 import sys
 from typing import Optional
 
@@ -23,32 +24,62 @@ from alert_alchemy.render import (
     render_status,
     render_traces,
 )
-from alert_alchemy.scoring import calculate_blast_radius
-from alert_alchemy.state import load_state, state_exists
+from alert_alchemy.scoring import calculate_blast_radius, calculate_blast_radius_batch
 
 
+# Color lookup tables hoisted out of the render loops
+_SEV_COLORS = {"critical": "red", "high": "yellow", "medium": "blue", "low": "green"}
+
+# Pre-wrapped severity cells so render loops do a dict lookup instead of
+# building the same markup string for every row.
+_SEV_WRAP = {sev: f"[{color}]{sev}[/]" for sev, color in _SEV_COLORS.items()}
+
+_BLAST_CELL = "[{0}]{1}[/]"
+
+
+def _blast_color(blast: int) -> str:
+    """Color for a blast radius value."""
+    if blast >= 70:
+        return "red"
+    if blast >= 40:
+        return "yellow"
+    return "green"
+
+
+@functools.lru_cache(maxsize=1)
 def is_interactive() -> bool:
-    """Check if running in an interactive terminal."""
+    """Check if running in an interactive terminal.
+
+    Cached: tty-ness cannot change within a process, and this runs on
+    every smart-action call. Tests simulating a different terminal
+    state can call is_interactive.cache_clear().
+    """
     return sys.stdin.isatty() and sys.stdout.isatty()
 
 
 def get_active_incidents(state: GameState) -> list[Incident]:
     """Get list of active (unresolved) incidents."""
-    return [inc for inc in state.incidents if not inc.resolved]
+    return state.active_incidents
 
 
 def get_incident_by_highest_blast_radius(incidents: list[Incident]) -> Optional[Incident]:
     """Get the incident with the highest blast radius."""
-    if not incidents:
-        return None
-    return max(incidents, key=lambda inc: calculate_blast_radius(inc))
+    # calculate_blast_radius is memoized per incident, so after the
+    # first pass this max() is pure cached-slot reads
+    return max(incidents, key=calculate_blast_radius, default=None)
 
 
 def render_compact_dashboard(state: GameState) -> None:
     """Render a compact dashboard showing game state."""
-    active = get_active_incidents(state)
-    resolved = len(state.incidents) - len(active)
-    
+    # Split active from resolved in one pass over the incident list
+    active: list[Incident] = []
+    resolved = 0
+    for inc in state.incidents:
+        if inc.resolved:
+            resolved += 1
+        else:
+            active.append(inc)
+
     # Header info
     header = f"📊 Step: [bold cyan]{state.current_step}[/] | Score: [bold {'green' if state.score >= 50 else 'red'}]{state.score}[/] | Resolved: [bold]{resolved}/{len(state.incidents)}[/]"
     
@@ -61,16 +92,15 @@ def render_compact_dashboard(state: GameState) -> None:
         table.add_column("Severity", justify="center")
         table.add_column("Blast", justify="center")
         
-        for i, inc in enumerate(active, 1):
-            blast = calculate_blast_radius(inc)
-            sev_color = {"critical": "red", "high": "yellow", "medium": "blue", "low": "green"}.get(inc.severity.lower(), "white")
-            blast_color = "red" if blast >= 70 else ("yellow" if blast >= 40 else "green")
+        blasts = calculate_blast_radius_batch(active)
+        for i, (inc, blast) in enumerate(zip(active, blasts), 1):
+            title = inc.title if len(inc.title) <= 40 else inc.title[:40] + "..."
             table.add_row(
                 str(i),
                 inc.id,
-                inc.title[:40] + ("..." if len(inc.title) > 40 else ""),
-                f"[{sev_color}]{inc.severity}[/]",
-                f"[{blast_color}]{blast}[/]",
+                title,
+                _SEV_WRAP.get(inc.severity.lower(), inc.severity),
+                _BLAST_CELL.format(_blast_color(blast), blast),
             )
         
         console.print(Panel(header, border_style="blue"))
@@ -196,46 +226,42 @@ def interactive_play_loop() -> None:
         console.print("[dim]Use individual commands instead: alert-alchemy status, action, etc.[/]")
         return
     
-    if not state_exists():
+    # One engine for the whole session: its cached state is the source
+    # of truth, so each iteration costs zero disk reads instead of the
+    # old reload-twice-per-loop pattern.
+    engine = Engine()
+
+    if engine.state is None:
         console.print("[yellow]No game in progress. Starting a new game...[/]")
-        engine = Engine()
         state = engine.start_game()
         console.print(f"[green]🎮 New game started! Loaded {len(state.incidents)} incident(s).[/]\n")
-    
-    engine = Engine()
-    
+
     console.print("[bold cyan]═══════════════════════════════════════[/]")
     console.print("[bold cyan]  🧪 Alert Alchemy - Interactive Mode  [/]")
     console.print("[bold cyan]═══════════════════════════════════════[/]\n")
-    
+
     while True:
-        state = load_state()
+        state = engine.state
         if not state:
             console.print("[red]Game state lost. Please restart.[/]")
             break
-        
+
         if state.ended:
             console.print("[yellow]Game has ended.[/]")
             render_game_end(state)
             break
-        
+
         render_compact_dashboard(state)
         render_menu()
-        
+
         try:
             choice = Prompt.ask("Your choice", default="1")
         except (KeyboardInterrupt, EOFError):
             console.print("\n[dim]Exiting play mode.[/]")
             break
-        
+
         console.print()  # Blank line
-        
-        # Reload state and engine for each action
-        engine = Engine()
-        state = load_state()
-        if not state:
-            break
-        
+
         if choice == "1":
             render_status(state)
         elif choice == "2":
@@ -293,13 +319,13 @@ def render_actions_list(state: GameState, incident_id: Optional[str] = None) ->
     for inc in incidents:
         blast = calculate_blast_radius(inc)
         status = "[green]✓ Resolved[/]" if inc.resolved else "[yellow]Active[/]"
-        blast_color = "red" if blast >= 70 else ("yellow" if blast >= 40 else "green")
         actions_str = ", ".join(inc.available_actions) if inc.available_actions else "[dim]None[/]"
-        
+        title = inc.title[:25] + "..." if len(inc.title) > 25 else inc.title
+
         table.add_row(
-            f"{inc.id}\n[dim]{inc.title[:25]}...[/]" if len(inc.title) > 25 else f"{inc.id}\n[dim]{inc.title}[/]",
+            f"{inc.id}\n[dim]{title}[/]",
             status,
-            f"[{blast_color}]{blast}[/]",
+            _BLAST_CELL.format(_blast_color(blast), blast),
             actions_str,
         )
     
@@ -331,11 +357,8 @@ def smart_action(
     target_incident: Optional[Incident] = None
     
     if incident_id:
-        # Explicit incident ID provided
-        for inc in active:
-            if inc.id == incident_id:
-                target_incident = inc
-                break
+        # Explicit incident ID provided - O(1) via the engine's index
+        target_incident = engine.get_active_incident(incident_id)
         if not target_incident:
             return False, f"Incident '{incident_id}' not found or already resolved."
     else:
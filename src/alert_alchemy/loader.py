@@ -1,18 +1,54 @@
 """Incident loader from YAML files."""
 
+import copy
+import functools
 import os
+import pickle
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 from alert_alchemy.models import Incident, Metrics
 
+# yaml is imported on first parse rather than at module load: warm
+# loads served from the sidecar cache never touch YAML at all.
+yaml = None
+_YamlLoader = None
+
+
+def _ensure_yaml() -> None:
+    """Import yaml and pick the parser on first use."""
+    global yaml, _YamlLoader
+    if yaml is None:
+        import yaml as _yaml
+
+        yaml = _yaml
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:  # libyaml not available, fall back to pure-Python parser
+            from yaml import SafeLoader as loader
+        _YamlLoader = loader
+
+# Sidecar cache of parsed incidents, keyed by source-file mtimes.
+# Warm loads skip YAML parsing entirely and unpickle ready-made objects.
+CACHE_FILENAME = ".incidents_cache.pkl"
+
+# In-process memo on top of the disk cache: repeat loads of an
+# unchanged directory (same mtime manifest) skip even the unpickling.
+# Callers get shallow copies so resolved-flag mutations don't leak back.
+_MEMO: dict[tuple, list[Incident]] = {}
+
 
+@functools.lru_cache(maxsize=8)
 def get_incidents_path(custom_path: str | None = None) -> Path:
     """Get the path to the incidents directory.
-    
+
+    The result is cached per custom_path for the life of the process:
+    the search stats up to four directories and the answer cannot change
+    within one CLI invocation. Tests that change cwd should call
+    get_incidents_path.cache_clear().
+
     Search order:
     1. Custom path if provided
     2. ./incidents relative to current working directory
@@ -78,51 +114,133 @@ def load_incidents(path: str | Path | None = None) -> list[Incident]:
         
     if not incidents_dir.exists():
         return []
-    
+
     incidents: list[Incident] = []
-    
-    for yaml_file in sorted(incidents_dir.glob("*.yaml")):
-        loaded = load_incident_file(yaml_file)
-        if loaded:
-            incidents.extend(loaded)
-    
-    for yml_file in sorted(incidents_dir.glob("*.yml")):
-        loaded = load_incident_file(yml_file)
-        if loaded:
-            incidents.extend(loaded)
-    
-    return incidents
+
+    # Single scandir pass for both extensions; DirEntry carries the stat
+    # result, so the mtime manifest comes for free.
+    entries: list[tuple[str, str, int]] = []
+    with os.scandir(incidents_dir) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith((".yaml", ".yml")):
+                entries.append((entry.name, entry.path, entry.stat().st_mtime_ns))
+    entries.sort()
+
+    if not entries:
+        return []
+
+    manifest = {name: mtime for name, _, mtime in entries}
+    sig = (str(incidents_dir), tuple(sorted(manifest.items())))
+    memoized = _MEMO.get(sig)
+    if memoized is not None:
+        return [copy.copy(inc) for inc in memoized]
+
+    cached = _read_cache(incidents_dir, manifest)
+    if cached is not None:
+        _MEMO[sig] = cached
+        return [copy.copy(inc) for inc in cached]
+
+    paths = [Path(entry_path) for _, entry_path, _ in entries]
+    if len(paths) < 4:
+        # Not worth spinning up a pool for a handful of files
+        for file_path in paths:
+            incidents.extend(load_incident_file(file_path))
+    else:
+        # libyaml releases the GIL while parsing and the rest is disk
+        # I/O, so threads give near-linear speedup on big directories.
+        # executor.map preserves input order.
+        with ThreadPoolExecutor(max_workers=min(16, len(paths))) as executor:
+            for loaded in executor.map(load_incident_file, paths):
+                incidents.extend(loaded)
+
+    _write_cache(incidents_dir, manifest, incidents)
+    _MEMO[sig] = incidents
+    return [copy.copy(inc) for inc in incidents]
+
+
+def _read_cache(incidents_dir: Path, manifest: dict[str, int]) -> Optional[list[Incident]]:
+    """Read cached incidents if the cache matches the current file mtimes.
+
+    Returns None on any mismatch or error, which falls back to YAML parsing.
+    """
+    cache_path = incidents_dir / CACHE_FILENAME
+    try:
+        payload = pickle.loads(cache_path.read_bytes())
+        if payload.get("manifest") != manifest:
+            return None
+        return payload["incidents"]
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_cache(incidents_dir: Path, manifest: dict[str, int], incidents: list[Incident]) -> None:
+    """Write the parsed-incident cache; failures are non-fatal."""
+    cache_path = incidents_dir / CACHE_FILENAME
+    tmp_path = incidents_dir / (CACHE_FILENAME + ".tmp")
+    try:
+        tmp_path.write_bytes(
+            pickle.dumps({"manifest": manifest, "incidents": incidents}, protocol=5)
+        )
+        # Atomic swap so a concurrent reader never sees a partial cache
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def iter_incidents(file_path: Path):
+    """Yield incidents from a YAML file one document at a time.
+
+    Documents are parsed and consumed incrementally, so a multi-document
+    bundle never holds more than one parsed document in memory at once.
+
+    Args:
+        file_path: Path to the YAML file.
+
+    Yields:
+        Incident objects from the file.
+    """
+    _ensure_yaml()
+    try:
+        # One read() syscall for the whole file; incident files are small,
+        # so handing libyaml a bytes buffer beats streaming through
+        # BufferedReader in repeated little reads.
+        raw = file_path.read_bytes()
+        for data in yaml.load_all(raw, Loader=_YamlLoader):
+            if data is None:
+                continue
+
+            # Handle both single incident and list of incidents. The
+            # YAML loader only produces exact list/dict instances, so
+            # `type(...) is` dispatch skips the isinstance MRO walk.
+            data_type = type(data)
+            if data_type is list:
+                for item in data:
+                    if item:
+                        yield parse_incident(item)
+            elif data_type is dict:
+                # Check if it's a wrapper with "incidents" key
+                wrapped = data.get("incidents")
+                if wrapped is not None:
+                    for item in wrapped:
+                        if item:
+                            yield parse_incident(item)
+                else:
+                    # Otherwise treat as single incident
+                    yield parse_incident(data)
+    except (yaml.YAMLError, OSError):
+        return
 
 
 def load_incident_file(file_path: Path) -> list[Incident]:
     """Load incidents from a single YAML file.
-    
+
     Args:
         file_path: Path to the YAML file.
-        
+
     Returns:
         List of incidents from the file.
     """
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-    except (yaml.YAMLError, OSError):
-        return []
-    
-    if data is None:
-        return []
-    
-    # Handle both single incident and list of incidents
-    if isinstance(data, list):
-        return [parse_incident(item) for item in data if item]
-    elif isinstance(data, dict):
-        # Check if it's a wrapper with "incidents" key
-        if "incidents" in data:
-            return [parse_incident(item) for item in data["incidents"] if item]
-        # Otherwise treat as single incident
-        return [parse_incident(data)]
-    
-    return []
+    return list(iter_incidents(file_path))
 
 
 def parse_incident(data: dict) -> Incident:
@@ -134,23 +252,28 @@ def parse_incident(data: dict) -> Incident:
     Returns:
         Parsed Incident object.
     """
-    metrics_data = data.get("metrics", {})
-    metrics = Metrics(
-        error_rate=metrics_data.get("error_rate"),
-        p95_latency=metrics_data.get("p95_latency"),
-        cpu_usage=metrics_data.get("cpu_usage"),
-        memory_usage=metrics_data.get("memory_usage"),
-        request_count=metrics_data.get("request_count"),
-    )
+    metrics_data = data.get("metrics")
+    if metrics_data:
+        metrics = Metrics(
+            error_rate=metrics_data.get("error_rate"),
+            p95_latency=metrics_data.get("p95_latency"),
+            cpu_usage=metrics_data.get("cpu_usage"),
+            memory_usage=metrics_data.get("memory_usage"),
+            request_count=metrics_data.get("request_count"),
+        )
+    else:
+        metrics = Metrics.EMPTY
     
     return Incident(
-        id=str(data.get("id", "")),
+        # Interned ids make the engine's dict lookups and equality
+        # checks pointer comparisons on the hot action path
+        id=sys.intern(str(data.get("id", ""))),
         title=data.get("title", "Untitled Incident"),
         description=data.get("description", ""),
         severity=data.get("severity", "medium"),
         metrics=metrics,
-        available_actions=data.get("available_actions", []),
-        correct_action=data.get("correct_action", ""),
+        available_actions=[sys.intern(a) for a in data.get("available_actions", [])],
+        correct_action=sys.intern(str(data.get("correct_action", ""))),
         resolved=data.get("resolved", False),
         logs=data.get("logs", []),
         traces=data.get("traces", []),
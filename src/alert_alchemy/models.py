@@ -1,13 +1,59 @@
 """Data models for Alert Alchemy game state and incidents."""
 
+import operator
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+# Serialization key tuples paired with attrgetters: one C-level call
+# fetches every field, and dict(zip(...)) reuses the interned keys
+# instead of rebuilding a dict literal per object.
+_METRICS_KEYS = (
+    "error_rate",
+    "p95_latency",
+    "cpu_usage",
+    "memory_usage",
+    "request_count",
+)
+_METRICS_GET = operator.attrgetter(*_METRICS_KEYS)
 
-@dataclass
+_INCIDENT_KEYS = (
+    "id",
+    "title",
+    "description",
+    "severity",
+    "available_actions",
+    "correct_action",
+    "resolved",
+    "resolved_at_step",
+    "logs",
+    "traces",
+)
+_INCIDENT_GET = operator.attrgetter(*_INCIDENT_KEYS)
+
+_ACTION_RECORD_KEYS = ("step", "incident_id", "action", "was_correct", "worsened")
+_ACTION_RECORD_GET = operator.attrgetter(*_ACTION_RECORD_KEYS)
+
+_GAME_STATE_KEYS = ("current_step", "score", "started_at", "ended", "ended_at")
+_GAME_STATE_GET = operator.attrgetter(*_GAME_STATE_KEYS)
+
+# Blast-radius value per severity, resolved once at construction so the
+# scoring fallback is a slot read instead of a lower() + dict lookup.
+_SEVERITY_RANK = {
+    "critical": 80,
+    "high": 60,
+    "medium": 40,
+    "low": 20,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Metrics:
-    """Metrics associated with an incident."""
+    """Metrics associated with an incident.
+
+    Frozen: metrics are fixed once loaded, which makes the shared
+    Metrics.EMPTY singleton safe for incidents without metric data.
+    """
     
     error_rate: float | None = None  # Percentage 0-100
     p95_latency: float | None = None  # Milliseconds
@@ -17,27 +63,30 @@ class Metrics:
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "error_rate": self.error_rate,
-            "p95_latency": self.p95_latency,
-            "cpu_usage": self.cpu_usage,
-            "memory_usage": self.memory_usage,
-            "request_count": self.request_count,
-        }
+        return dict(zip(_METRICS_KEYS, _METRICS_GET(self)))
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Metrics":
         """Create from dictionary."""
+        # Local .get and positional construction: this runs once per
+        # incident per state load, so skip the repeated method lookups
+        # and keyword-argument unpacking.
+        get = data.get
         return cls(
-            error_rate=data.get("error_rate"),
-            p95_latency=data.get("p95_latency"),
-            cpu_usage=data.get("cpu_usage"),
-            memory_usage=data.get("memory_usage"),
-            request_count=data.get("request_count"),
+            get("error_rate"),
+            get("p95_latency"),
+            get("cpu_usage"),
+            get("memory_usage"),
+            get("request_count"),
         )
 
 
-@dataclass
+# Shared all-defaults instance: incidents without metrics reuse it
+# instead of allocating a fresh empty Metrics each.
+Metrics.EMPTY = Metrics()
+
+
+@dataclass(slots=True)
 class Incident:
     """Represents an incident in the game."""
     
@@ -52,44 +101,57 @@ class Incident:
     resolved_at_step: int | None = None
     logs: list[str] = field(default_factory=list)
     traces: list[str] = field(default_factory=list)
-    
+    # Memoized blast radius, populated by scoring.calculate_blast_radius.
+    # Declared so it has a slot; excluded from repr/compare/serialization.
+    _blast_radius_cache: int | None = field(default=None, repr=False, compare=False)
+    # Frozenset mirror of available_actions for O(1) membership checks;
+    # kept in sync through add_action.
+    _available_actions_set: frozenset[str] = field(init=False, repr=False, compare=False, default=frozenset())
+    # Severity encoded as its fallback blast value; derived, not serialized.
+    severity_rank: int = field(init=False, repr=False, compare=False, default=40)
+
+    def __post_init__(self) -> None:
+        """Derive the action membership set and severity rank."""
+        self._available_actions_set = frozenset(self.available_actions)
+        self.severity_rank = _SEVERITY_RANK.get(self.severity.lower(), 40)
+
+    def add_action(self, action: str) -> None:
+        """Add an available action, keeping the membership set in sync.
+
+        Args:
+            action: The action to make available.
+        """
+        self.available_actions.append(action)
+        self._available_actions_set = frozenset(self.available_actions)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "severity": self.severity,
-            "metrics": self.metrics.to_dict(),
-            "available_actions": self.available_actions,
-            "correct_action": self.correct_action,
-            "resolved": self.resolved,
-            "resolved_at_step": self.resolved_at_step,
-            "logs": self.logs,
-            "traces": self.traces,
-        }
+        data = dict(zip(_INCIDENT_KEYS, _INCIDENT_GET(self)))
+        data["metrics"] = self.metrics.to_dict()
+        return data
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Incident":
         """Create from dictionary."""
-        metrics_data = data.get("metrics", {})
-        metrics = Metrics.from_dict(metrics_data) if metrics_data else Metrics()
+        get = data.get
+        metrics_data = get("metrics")
+        metrics = Metrics.from_dict(metrics_data) if metrics_data else Metrics.EMPTY
         return cls(
-            id=data["id"],
-            title=data["title"],
-            description=data.get("description", ""),
-            severity=data.get("severity", "medium"),
-            metrics=metrics,
-            available_actions=data.get("available_actions", []),
-            correct_action=data.get("correct_action", ""),
-            resolved=data.get("resolved", False),
-            resolved_at_step=data.get("resolved_at_step"),
-            logs=data.get("logs", []),
-            traces=data.get("traces", []),
+            data["id"],
+            data["title"],
+            get("description", ""),
+            get("severity", "medium"),
+            metrics,
+            get("available_actions", []),
+            get("correct_action", ""),
+            get("resolved", False),
+            get("resolved_at_step"),
+            get("logs", []),
+            get("traces", []),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionRecord:
     """Record of an action taken during the game."""
     
@@ -101,27 +163,21 @@ class ActionRecord:
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "step": self.step,
-            "incident_id": self.incident_id,
-            "action": self.action,
-            "was_correct": self.was_correct,
-            "worsened": self.worsened,
-        }
+        return dict(zip(_ACTION_RECORD_KEYS, _ACTION_RECORD_GET(self)))
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ActionRecord":
         """Create from dictionary."""
         return cls(
-            step=data["step"],
-            incident_id=data["incident_id"],
-            action=data["action"],
-            was_correct=data["was_correct"],
-            worsened=data.get("worsened", False),
+            data["step"],
+            data["incident_id"],
+            data["action"],
+            data["was_correct"],
+            data.get("worsened", False),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Complete state of a game session."""
     
@@ -132,23 +188,27 @@ class GameState:
     started_at: str = ""
     ended: bool = False
     ended_at: str | None = None
-    
+    # Derived view of unresolved incidents, maintained by the engine as
+    # incidents resolve so readers never re-filter the full list. Not
+    # serialized; rebuilt from the resolved flags on construction.
+    active_incidents: list[Incident] = field(init=False, repr=False, compare=False, default_factory=list)
+    # Lookup index by incident id so finds are a hash probe instead of
+    # a linear scan. Rebuilt on construction; not serialized.
+    _by_id: dict[str, Incident] = field(init=False, repr=False, compare=False, default_factory=dict)
+
     def __post_init__(self) -> None:
-        """Set started_at if not provided."""
+        """Set started_at if not provided; derive the active list and index."""
         if not self.started_at:
             self.started_at = datetime.now().isoformat()
+        self.active_incidents = [inc for inc in self.incidents if not inc.resolved]
+        self._by_id = {inc.id: inc for inc in self.incidents}
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "current_step": self.current_step,
-            "score": self.score,
-            "incidents": [inc.to_dict() for inc in self.incidents],
-            "actions_taken": [act.to_dict() for act in self.actions_taken],
-            "started_at": self.started_at,
-            "ended": self.ended,
-            "ended_at": self.ended_at,
-        }
+        data = dict(zip(_GAME_STATE_KEYS, _GAME_STATE_GET(self)))
+        data["incidents"] = [inc.to_dict() for inc in self.incidents]
+        data["actions_taken"] = [act.to_dict() for act in self.actions_taken]
+        return data
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "GameState":
@@ -10,16 +10,18 @@ from alert_alchemy.scoring import calculate_blast_radius, get_score_breakdown
 
 console = Console()
 
+# Hoisted so the dict is allocated once, not per call
+_SEVERITY_COLORS = {
+    "critical": "red",
+    "high": "orange1",
+    "medium": "yellow",
+    "low": "green",
+}
+
 
 def get_severity_color(severity: str) -> str:
     """Get color for severity level."""
-    colors = {
-        "critical": "red",
-        "high": "orange1",
-        "medium": "yellow",
-        "low": "green",
-    }
-    return colors.get(severity.lower(), "white")
+    return _SEVERITY_COLORS.get(severity.lower(), "white")
 
 
 def render_status(state: GameState) -> None:
@@ -34,18 +36,19 @@ def render_status(state: GameState) -> None:
         console.print("[yellow]Game has ended.[/yellow]")
         return
     
-    active_incidents = [inc for inc in state.incidents if not inc.resolved]
-    resolved_incidents = [inc for inc in state.incidents if inc.resolved]
-    
+    # GameState maintains the active list; resolved count falls out of it
+    active_incidents = state.active_incidents
+    resolved_count = len(state.incidents) - len(active_incidents)
+
     if not active_incidents:
         console.print("[green]No active incidents. All clear![/green]")
     else:
         console.print(f"\n[bold red]Active Incidents: {len(active_incidents)}[/bold red]")
         for incident in active_incidents:
             render_incident_summary(incident)
-    
-    if resolved_incidents:
-        console.print(f"\n[bold green]Resolved: {len(resolved_incidents)}[/bold green]")
+
+    if resolved_count:
+        console.print(f"\n[bold green]Resolved: {resolved_count}[/bold green]")
 
 
 def render_incident_summary(incident: Incident) -> None:
@@ -85,21 +88,24 @@ def render_incident_detail(incident: Incident) -> None:
 def render_logs(state: GameState) -> None:
     """Render logs for all active incidents."""
     console.print("\n[bold cyan]📋 Incident Logs[/bold cyan]\n")
-    
-    active_incidents = [inc for inc in state.incidents if not inc.resolved]
+
+    active_incidents = state.active_incidents
     
     if not active_incidents:
         console.print("[dim]No active incidents.[/dim]")
         return
     
+    # One console.print for the whole block: Rich measures the terminal
+    # and flushes per print call, so batching beats a print per line.
+    lines: list[str] = []
     for incident in active_incidents:
-        console.print(f"[bold]{incident.id}[/bold] - {incident.title}")
+        lines.append(f"[bold]{incident.id}[/bold] - {incident.title}")
         if incident.logs:
-            for log in incident.logs:
-                console.print(f"  [dim]{log}[/dim]")
+            lines.extend(f"  [dim]{log}[/dim]" for log in incident.logs)
         else:
-            console.print("  [dim]No logs available.[/dim]")
-        console.print()
+            lines.append("  [dim]No logs available.[/dim]")
+        lines.append("")
+    console.print("\n".join(lines))
 
 
 def render_metrics(state: GameState) -> None:
@@ -133,21 +139,23 @@ def render_metrics(state: GameState) -> None:
 def render_traces(state: GameState) -> None:
     """Render traces for all active incidents."""
     console.print("\n[bold cyan]🔍 Incident Traces[/bold cyan]\n")
-    
-    active_incidents = [inc for inc in state.incidents if not inc.resolved]
+
+    active_incidents = state.active_incidents
     
     if not active_incidents:
         console.print("[dim]No active incidents.[/dim]")
         return
     
+    # Batched into one print, same as render_logs
+    lines: list[str] = []
     for incident in active_incidents:
-        console.print(f"[bold]{incident.id}[/bold] - {incident.title}")
+        lines.append(f"[bold]{incident.id}[/bold] - {incident.title}")
         if incident.traces:
-            for trace in incident.traces:
-                console.print(f"  [cyan]{trace}[/cyan]")
+            lines.extend(f"  [cyan]{trace}[/cyan]" for trace in incident.traces)
         else:
-            console.print("  [dim]No traces available.[/dim]")
-        console.print()
+            lines.append("  [dim]No traces available.[/dim]")
+        lines.append("")
+    console.print("\n".join(lines))
 
 
 def render_score_breakdown(state: GameState) -> None:
@@ -178,8 +186,8 @@ def render_game_end(state: GameState) -> None:
         style="bold cyan",
     ))
     
-    resolved = len([inc for inc in state.incidents if inc.resolved])
     total = len(state.incidents)
+    resolved = total - len(state.active_incidents)
     
     console.print(f"\nIncidents Resolved: [bold]{resolved}/{total}[/bold]")
     console.print(f"Total Steps: [bold]{state.current_step}[/bold]")
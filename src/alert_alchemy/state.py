@@ -4,62 +4,92 @@ import json
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json works fine without it
+    orjson = None
+
 from alert_alchemy.models import GameState
 
 STATE_FILENAME = ".alert_alchemy_state.json"
 
 
-def get_state_path() -> Path:
-    """Get the path to the state file in the current working directory."""
-    return Path.cwd() / STATE_FILENAME
+def get_state_path(state_dir: Path | None = None) -> Path:
+    """Get the path to the state file.
+
+    Args:
+        state_dir: Directory holding the state file. Defaults to the
+            current working directory.
+    """
+    return (state_dir if state_dir is not None else Path.cwd()) / STATE_FILENAME
 
 
-def save_state(state: GameState) -> None:
+def save_state(state: GameState, state_dir: Path | None = None) -> None:
     """Save game state to the state file.
-    
+
     Args:
         state: The game state to save.
+        state_dir: Optional directory for the state file.
     """
-    state_path = get_state_path()
-    with open(state_path, "w", encoding="utf-8") as f:
-        json.dump(state.to_dict(), f, indent=2)
+    state_path = get_state_path(state_dir)
+    # The engine rewrites this file on every action, so serialization
+    # speed matters; orjson encodes in native code when available.
+    if orjson is not None:
+        state_path.write_bytes(orjson.dumps(state.to_dict()))
+    else:
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump(state.to_dict(), f, separators=(",", ":"))
 
 
-def load_state() -> Optional[GameState]:
+def load_state(state_dir: Path | None = None) -> Optional[GameState]:
     """Load game state from the state file.
-    
+
+    Args:
+        state_dir: Optional directory for the state file.
+
     Returns:
         The loaded game state, or None if no state file exists.
     """
-    state_path = get_state_path()
-    if not state_path.exists():
+    state_path = get_state_path(state_dir)
+    try:
+        # read_bytes is a single open/read/close with no buffered layer;
+        # letting it raise also drops the separate exists() stat.
+        raw = state_path.read_bytes()
+    except FileNotFoundError:
         return None
-    
+
     try:
-        with open(state_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # orjson decodes UTF-8 bytes natively; stdlib json.loads also
+        # accepts bytes, so neither path needs a TextIOWrapper.
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return GameState.from_dict(data)
-    except (json.JSONDecodeError, KeyError, TypeError):
+    except (ValueError, KeyError, TypeError):
         return None
 
 
-def delete_state() -> bool:
+def delete_state(state_dir: Path | None = None) -> bool:
     """Delete the state file.
-    
+
+    Args:
+        state_dir: Optional directory for the state file.
+
     Returns:
         True if the file was deleted, False if it didn't exist.
     """
-    state_path = get_state_path()
+    state_path = get_state_path(state_dir)
     if state_path.exists():
         state_path.unlink()
         return True
     return False
 
 
-def state_exists() -> bool:
+def state_exists(state_dir: Path | None = None) -> bool:
     """Check if a state file exists.
-    
+
+    Args:
+        state_dir: Optional directory for the state file.
+
     Returns:
         True if the state file exists.
     """
-    return get_state_path().exists()
+    return get_state_path(state_dir).exists()
@@ -1,77 +1,106 @@
 """Utility functions for Alert Alchemy."""
 
-import uuid
+import functools
+import secrets
 from datetime import datetime
 
 
 def generate_id(prefix: str = "") -> str:
     """Generate a unique ID with optional prefix.
-    
+
     Args:
         prefix: Optional prefix for the ID.
-        
+
     Returns:
         A unique ID string.
     """
-    short_uuid = str(uuid.uuid4())[:8]
+    # 8 hex chars, same 32 bits of entropy as slicing uuid4() but
+    # without the UUID construction and hyphenated formatting
+    short_uuid = secrets.token_hex(4)
     if prefix:
         return f"{prefix}-{short_uuid}"
     return short_uuid
 
 
+@functools.lru_cache(maxsize=1024)
 def format_timestamp(iso_timestamp: str) -> str:
     """Format an ISO timestamp for display.
-    
+
+    Memoized: renders repeatedly format the same started_at/ended_at
+    strings, so repeat calls are pure cache hits.
+
     Args:
         iso_timestamp: ISO format timestamp string.
-        
+
     Returns:
         Human-readable timestamp.
     """
+    # Cheap shape check so malformed input returns early instead of
+    # paying for a raised-and-caught ValueError
+    if not isinstance(iso_timestamp, str) or len(iso_timestamp) < 19 or iso_timestamp[4] != "-":
+        return iso_timestamp
     try:
         dt = datetime.fromisoformat(iso_timestamp)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except (ValueError, TypeError):
+    except ValueError:
         return iso_timestamp
 
 
+def _format_delta_seconds(total_seconds: int) -> str:
+    """Format a second count as h/m/s."""
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    else:
+        return f"{seconds}s"
+
+
+@functools.lru_cache(maxsize=256)
+def _duration_between(start_iso: str, end_iso: str) -> str:
+    """Memoized duration between two fixed timestamps."""
+    try:
+        start = datetime.fromisoformat(start_iso)
+        end = datetime.fromisoformat(end_iso)
+        return _format_delta_seconds(int((end - start).total_seconds()))
+    except (ValueError, TypeError):
+        return "unknown"
+
+
 def format_duration(start_iso: str, end_iso: str | None = None) -> str:
     """Format duration between two timestamps.
-    
+
     Args:
         start_iso: Start timestamp in ISO format.
         end_iso: End timestamp in ISO format (defaults to now).
-        
+
     Returns:
         Human-readable duration string.
     """
+    if end_iso is not None:
+        # Both endpoints fixed (e.g. a finished game rendered several
+        # times) - safe to memoize
+        return _duration_between(start_iso, end_iso)
+
     try:
         start = datetime.fromisoformat(start_iso)
-        end = datetime.fromisoformat(end_iso) if end_iso else datetime.now()
-        delta = end - start
-        
-        total_seconds = int(delta.total_seconds())
-        hours, remainder = divmod(total_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        
-        if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
+        delta = datetime.now() - start
+        return _format_delta_seconds(int(delta.total_seconds()))
     except (ValueError, TypeError):
         return "unknown"
 
 
 def clamp(value: int | float, min_val: int | float, max_val: int | float) -> int | float:
     """Clamp a value between min and max.
-    
+
     Args:
         value: The value to clamp.
         min_val: Minimum allowed value.
         max_val: Maximum allowed value.
-        
+
     Returns:
         Clamped value.
     """
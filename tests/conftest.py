@@ -0,0 +1,34 @@
+"""Shared pytest configuration for the test suite."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from alert_alchemy.state import delete_state
+
+
+@pytest.fixture(scope="session")
+def scripts_modules() -> SimpleNamespace:
+    """Import the scripts/ modules once for the whole session.
+
+    scripts/ is on pytest's pythonpath (pyproject.toml), so the imports
+    go through pytest's assertion-rewrite machinery and its bytecode
+    cache instead of a manual sys.path insert at test time.
+    """
+    import export_web_data
+    import generate_incident_pack
+
+    return SimpleNamespace(
+        generate_incident_pack=generate_incident_pack,
+        export_web_data=export_web_data,
+    )
+
+
+def pytest_sessionstart(session) -> None:
+    """Start every run from a clean slate, once.
+
+    Per-test cleanup is handled by the clean_state fixture in the tests
+    that actually persist state; this guards against a stray state file
+    left in the working directory by an interactive session.
+    """
+    delete_state()
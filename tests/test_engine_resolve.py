@@ -1,22 +1,19 @@
 """Tests for the game engine resolution logic."""
 
+import copy
 import json
-import os
-import tempfile
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
 from alert_alchemy.engine import Engine
-from alert_alchemy.models import ActionRecord, GameState, Incident, Metrics
+from alert_alchemy.models import GameState, Incident, Metrics
 from alert_alchemy.state import STATE_FILENAME
 
 
-@pytest.fixture
-def sample_incident() -> Incident:
-    """Create a sample incident for testing."""
-    return Incident(
+def _make_sample_state() -> GameState:
+    """Build the canonical single-incident game state used by the fixtures."""
+    incident = Incident(
         id="INC-001",
         title="High Error Rate",
         description="Error rate is above threshold",
@@ -25,39 +22,49 @@ def sample_incident() -> Incident:
         available_actions=["scale_up", "restart_service", "rollback"],
         correct_action="rollback",
     )
-
-
-@pytest.fixture
-def sample_state(sample_incident: Incident) -> GameState:
-    """Create a sample game state for testing."""
     return GameState(
         current_step=0,
         score=100,
-        incidents=[sample_incident],
+        incidents=[incident],
         actions_taken=[],
         started_at="2024-01-01T00:00:00",
         ended=False,
     )
 
 
+# Serialized once at import; the fixture writes these bytes directly
+# instead of re-running to_dict + json.dump per setup.
+_SAMPLE_STATE_BYTES = json.dumps(
+    _make_sample_state().to_dict(), separators=(",", ":")
+).encode()
+
+
+@pytest.fixture(scope="session")
+def _engine_template(tmp_path_factory: pytest.TempPathFactory):
+    """Write the state file and build the engine once per session.
+
+    Returns the engine plus a pristine state dict that the per-test
+    fixture restores from, so individual tests pay for a dict copy
+    instead of a JSON round-trip through the filesystem. Pointing the
+    engine at state_dir avoids process-global chdir entirely.
+    """
+    state_dir = tmp_path_factory.mktemp("engine")
+
+    (state_dir / STATE_FILENAME).write_bytes(_SAMPLE_STATE_BYTES)
+
+    engine = Engine(state_dir=state_dir)
+    initial_state_dict = engine.state.to_dict()
+
+    return engine, initial_state_dict
+
+
 @pytest.fixture
-def engine_with_state(tmp_path: Path, sample_state: GameState):
-    """Create an engine with pre-populated state."""
-    # Change to temp directory
-    original_cwd = os.getcwd()
-    os.chdir(tmp_path)
-    
-    # Write state file
-    state_file = tmp_path / STATE_FILENAME
-    with open(state_file, "w") as f:
-        json.dump(sample_state.to_dict(), f)
-    
-    engine = Engine()
-    
-    yield engine
-    
-    # Cleanup
-    os.chdir(original_cwd)
+def engine_with_state(_engine_template) -> Engine:
+    """Engine reset to the pristine sample state before each test."""
+    engine, initial_state_dict = _engine_template
+    engine._state = GameState.from_dict(copy.deepcopy(initial_state_dict))
+    engine._dirty = False
+    return engine
 
 
 class TestEngineResolve:
@@ -228,7 +235,7 @@ class TestEngineWorsenDetection:
         """Restart action when not correct should mark as worsened."""
         # Add restart as available action
         incident = engine_with_state._find_incident("INC-001")
-        incident.available_actions.append("restart_pods")
+        incident.add_action("restart_pods")
         
         engine_with_state.take_action("INC-001", "restart_pods")
         
@@ -245,33 +252,24 @@ class TestEngineWorsenDetection:
         assert record.worsened is False
 
 
+@pytest.fixture(scope="module")
+def empty_engine(tmp_path_factory: pytest.TempPathFactory) -> Engine:
+    """One engine pointed at an empty state directory."""
+    return Engine(state_dir=tmp_path_factory.mktemp("no_state"))
+
+
 class TestEngineNoState:
     """Tests for engine behavior without state."""
-    
-    def test_action_without_state_fails(self, tmp_path: Path) -> None:
-        """Actions should fail when no state exists."""
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        
-        try:
-            engine = Engine()
-            success, message = engine.take_action("INC-001", "scale_up")
-            
-            assert success is False
-            assert "start" in message.lower()
-        finally:
-            os.chdir(original_cwd)
-    
-    def test_tick_without_state_fails(self, tmp_path: Path) -> None:
-        """Tick should fail when no state exists."""
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        
-        try:
-            engine = Engine()
-            success, message = engine.tick()
-            
-            assert success is False
-            assert "start" in message.lower()
-        finally:
-            os.chdir(original_cwd)
+
+    @pytest.mark.parametrize(
+        "method_name,args",
+        [("take_action", ("INC-001", "scale_up")), ("tick", ())],
+    )
+    def test_operation_without_state_fails(
+        self, empty_engine: Engine, method_name: str, args: tuple
+    ) -> None:
+        """Engine operations should fail when no state exists."""
+        success, message = getattr(empty_engine, method_name)(*args)
+
+        assert success is False
+        assert "start" in message.lower()
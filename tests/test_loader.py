@@ -10,20 +10,32 @@ import yaml
 from alert_alchemy.loader import load_incidents, load_incident_file, parse_incident
 
 
+@pytest.fixture(scope="module")
+def loader_tmp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One temp root per module; each test writes into its own subdir.
+
+    Cheaper than a fresh function-scoped tmp_path per test, and distinct
+    subdirs keep the tests isolated from each other.
+    """
+    return tmp_path_factory.mktemp("loader")
+
+
 class TestLoadIncidents:
     """Tests for the load_incidents function."""
-    
+
     def test_load_from_nonexistent_directory(self) -> None:
         """Should return empty list for nonexistent directory."""
         result = load_incidents("/nonexistent/path/that/does/not/exist")
         assert result == []
-    
-    def test_load_from_empty_directory(self, tmp_path: Path) -> None:
+
+    def test_load_from_empty_directory(self, loader_tmp_dir: Path) -> None:
         """Should return empty list for empty directory."""
-        result = load_incidents(str(tmp_path))
+        empty_dir = loader_tmp_dir / "empty"
+        empty_dir.mkdir()
+        result = load_incidents(str(empty_dir))
         assert result == []
-    
-    def test_load_single_incident_yaml(self, tmp_path: Path) -> None:
+
+    def test_load_single_incident_yaml(self, loader_tmp_dir: Path) -> None:
         """Should load a single incident from YAML file."""
         incident_data = {
             "id": "INC-001",
@@ -38,12 +50,13 @@ class TestLoadIncidents:
             "correct_action": "scale_up",
         }
         
-        yaml_file = tmp_path / "incident.yaml"
-        with open(yaml_file, "w") as f:
+        incident_dir = loader_tmp_dir / "single"
+        incident_dir.mkdir()
+        with open(incident_dir / "incident.yaml", "w") as f:
             yaml.dump(incident_data, f)
-        
-        result = load_incidents(str(tmp_path))
-        
+
+        result = load_incidents(str(incident_dir))
+
         assert len(result) == 1
         assert result[0].id == "INC-001"
         assert result[0].title == "High CPU Usage"
@@ -51,7 +64,7 @@ class TestLoadIncidents:
         assert result[0].metrics.cpu_usage == 95.0
         assert result[0].correct_action == "scale_up"
     
-    def test_load_multiple_incidents_from_list(self, tmp_path: Path) -> None:
+    def test_load_multiple_incidents_from_list(self, loader_tmp_dir: Path) -> None:
         """Should load multiple incidents from a YAML list."""
         incidents_data = [
             {
@@ -68,17 +81,18 @@ class TestLoadIncidents:
             },
         ]
         
-        yaml_file = tmp_path / "incidents.yaml"
-        with open(yaml_file, "w") as f:
+        incident_dir = loader_tmp_dir / "from_list"
+        incident_dir.mkdir()
+        with open(incident_dir / "incidents.yaml", "w") as f:
             yaml.dump(incidents_data, f)
-        
-        result = load_incidents(str(tmp_path))
-        
+
+        result = load_incidents(str(incident_dir))
+
         assert len(result) == 2
         assert result[0].id == "INC-001"
         assert result[1].id == "INC-002"
     
-    def test_load_incidents_with_wrapper_key(self, tmp_path: Path) -> None:
+    def test_load_incidents_with_wrapper_key(self, loader_tmp_dir: Path) -> None:
         """Should load incidents from a dict with 'incidents' key."""
         incidents_data = {
             "incidents": [
@@ -91,33 +105,37 @@ class TestLoadIncidents:
             ]
         }
         
-        yaml_file = tmp_path / "wrapped.yaml"
-        with open(yaml_file, "w") as f:
+        incident_dir = loader_tmp_dir / "wrapped"
+        incident_dir.mkdir()
+        with open(incident_dir / "wrapped.yaml", "w") as f:
             yaml.dump(incidents_data, f)
-        
-        result = load_incidents(str(tmp_path))
-        
+
+        result = load_incidents(str(incident_dir))
+
         assert len(result) == 1
         assert result[0].id == "INC-001"
     
-    def test_load_from_multiple_files(self, tmp_path: Path) -> None:
+    def test_load_from_multiple_files(self, loader_tmp_dir: Path) -> None:
         """Should load from multiple YAML files."""
+        incident_dir = loader_tmp_dir / "multi_file"
+        incident_dir.mkdir()
+
         # File 1
-        with open(tmp_path / "a_first.yaml", "w") as f:
+        with open(incident_dir / "a_first.yaml", "w") as f:
             yaml.dump({"id": "INC-A", "title": "A", "description": "", "severity": "low"}, f)
-        
+
         # File 2
-        with open(tmp_path / "b_second.yaml", "w") as f:
+        with open(incident_dir / "b_second.yaml", "w") as f:
             yaml.dump({"id": "INC-B", "title": "B", "description": "", "severity": "high"}, f)
-        
-        result = load_incidents(str(tmp_path))
+
+        result = load_incidents(str(incident_dir))
         
         assert len(result) == 2
         # Should be sorted by filename
         assert result[0].id == "INC-A"
         assert result[1].id == "INC-B"
     
-    def test_load_yml_extension(self, tmp_path: Path) -> None:
+    def test_load_yml_extension(self, loader_tmp_dir: Path) -> None:
         """Should also load .yml files."""
         incident_data = {
             "id": "INC-YML",
@@ -126,12 +144,13 @@ class TestLoadIncidents:
             "severity": "critical",
         }
         
-        yml_file = tmp_path / "incident.yml"
-        with open(yml_file, "w") as f:
+        incident_dir = loader_tmp_dir / "yml_ext"
+        incident_dir.mkdir()
+        with open(incident_dir / "incident.yml", "w") as f:
             yaml.dump(incident_data, f)
-        
-        result = load_incidents(str(tmp_path))
-        
+
+        result = load_incidents(str(incident_dir))
+
         assert len(result) == 1
         assert result[0].id == "INC-YML"
 
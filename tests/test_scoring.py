@@ -256,24 +256,29 @@ class TestCalculateBlastRadius:
         blast_radius = calculate_blast_radius(incident)
         assert blast_radius == 100
     
-    def test_blast_radius_fallback_to_severity(self) -> None:
-        """Should use severity when no metrics available."""
-        for severity, expected in [
+    @pytest.mark.parametrize(
+        "severity,expected",
+        [
             ("critical", 80),
             ("high", 60),
             ("medium", 40),
             ("low", 20),
-        ]:
-            incident = Incident(
-                id="INC-001",
-                title="Test",
-                description="",
-                severity=severity,
-                metrics=Metrics(),  # No metrics
-            )
-            
-            blast_radius = calculate_blast_radius(incident)
-            assert blast_radius == expected, f"Failed for severity: {severity}"
+        ],
+    )
+    def test_blast_radius_fallback_to_severity(
+        self, severity: str, expected: int
+    ) -> None:
+        """Should use severity when no metrics available."""
+        incident = Incident(
+            id="INC-001",
+            title="Test",
+            description="",
+            severity=severity,
+            metrics=Metrics.EMPTY,  # No metrics
+        )
+
+        blast_radius = calculate_blast_radius(incident)
+        assert blast_radius == expected
     
     def test_blast_radius_zero_metrics(self) -> None:
         """Zero metrics should give zero blast radius from metrics."""
@@ -1,79 +1,69 @@
 """Tests for web data scripts (generator and export)."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
 
 
-def test_generate_incident_pack_creates_files():
-    """Test that generate_incident_pack creates YAML files."""
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-    
-    from generate_incident_pack import generate_incident, generate_seed_rng, write_yaml
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_dir = Path(tmpdir)
-        rng = generate_seed_rng("test-seed")
-        
-        # Generate 5 incidents
-        for i in range(1, 6):
-            incident = generate_incident(rng, i)
-            filepath = output_dir / f"{incident['id']}.yaml"
-            write_yaml(incident, filepath)
-        
-        # Verify files created
-        yaml_files = list(output_dir.glob("*.yaml"))
-        assert len(yaml_files) == 5
-        
-        # Verify content
-        content = yaml_files[0].read_text()
-        assert "id:" in content
-        assert "title:" in content
-        assert "severity:" in content
-
-
-def test_generate_incident_pack_deterministic():
+@pytest.fixture(scope="session")
+def generated_incidents(scripts_modules) -> list[dict]:
+    """Generate five incidents from a fixed seed, once per session.
+
+    The generator is deterministic, so the same list serves every test
+    that only inspects generated output.
+    """
+    gen = scripts_modules.generate_incident_pack
+    rng = gen.generate_seed_rng("test-seed")
+    return [gen.generate_incident(rng, i) for i in range(1, 6)]
+
+
+def test_generate_incident_pack_serializes(generated_incidents, scripts_modules):
+    """Test that generated incidents serialize to complete YAML."""
+    assert len(generated_incidents) == 5
+
+    # One in-memory round-trip through the YAML dumper proves
+    # serializability without a tempdir full of files.
+    content = scripts_modules.generate_incident_pack.dump_yaml(
+        generated_incidents[0]
+    ).decode("utf-8")
+    assert "id:" in content
+    assert "title:" in content
+    assert "severity:" in content
+
+
+def test_generate_incident_pack_deterministic(generated_incidents, scripts_modules):
     """Test that same seed produces same incidents."""
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-    
-    from generate_incident_pack import generate_incident, generate_seed_rng
-    
-    rng1 = generate_seed_rng("same-seed")
-    incident1 = generate_incident(rng1, 1)
-    
-    rng2 = generate_seed_rng("same-seed")
-    incident2 = generate_incident(rng2, 1)
-    
-    assert incident1["id"] == incident2["id"]
-    assert incident1["title"] == incident2["title"]
-    assert incident1["severity"] == incident2["severity"]
-
-
-def test_export_produces_valid_json():
+    gen = scripts_modules.generate_incident_pack
+
+    rng = gen.generate_seed_rng("test-seed")
+    regenerated = gen.generate_incident(rng, 1)
+    first = generated_incidents[0]
+
+    assert regenerated["id"] == first["id"]
+    assert regenerated["title"] == first["title"]
+    assert regenerated["severity"] == first["severity"]
+
+
+def test_export_produces_valid_json(scripts_modules, tmp_path: Path):
     """Test that export produces valid JSON with required fields."""
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-    
-    repo_root = Path(__file__).parent.parent
-    output_file = repo_root / "web" / "data" / "incidents.json"
-    
-    # Run export (assuming incidents exist)
-    from export_web_data import main
-    result = main()
-    assert result == 0
-    
-    # Verify JSON
-    assert output_file.exists()
-    with open(output_file) as f:
-        incidents = json.load(f)
-    
+    gen = scripts_modules.generate_incident_pack
+
+    # Build a small fixture pack instead of exporting the repo's full
+    # incident directory into the real web/data output file.
+    rng = gen.generate_seed_rng("export-test")
+    for i in range(1, 4):
+        incident = gen.generate_incident(rng, i)
+        gen.write_yaml(incident, tmp_path / f"{incident['id']}.yaml")
+
+    incidents = scripts_modules.export_web_data.build_incidents_list(tmp_path)
+
     assert isinstance(incidents, list)
-    assert len(incidents) >= 1
-    
+    assert len(incidents) == 3
+
+    # Round-trip through JSON to confirm the export shape serializes
+    incidents = json.loads(json.dumps(incidents))
+
     # Check required fields
     for inc in incidents:
         assert "id" in inc
@@ -82,18 +72,13 @@ def test_export_produces_valid_json():
         assert "severity_rank" in inc
 
 
-def test_incident_has_derived_fields():
+def test_incident_has_derived_fields(scripts_modules):
     """Test that exported incidents have derived fields."""
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-    
-    from export_web_data import load_incident
-    
     repo_root = Path(__file__).parent.parent
     yaml_files = list((repo_root / "incidents").glob("*.yaml"))
-    
+
     if yaml_files:
-        incident = load_incident(yaml_files[0])
+        incident = scripts_modules.export_web_data.load_incident(yaml_files[0])
         assert incident is not None
         assert "short_summary" in incident
         assert "severity_rank" in incident